@@ -1,7 +1,6 @@
 import numpy as np
-import tensorflow as tf
 import json
-from utils import forward_kinematics, forward_kinematics_TF
+from utils import forward_kinematics
 from utils.dh_params import dh_params
 
 def generate_dataset(angle_range=75, num_samples=100000):
@@ -18,6 +17,7 @@ def generate_dataset(angle_range=75, num_samples=100000):
     thetas = np.random.uniform(-angle_range, angle_range, (num_samples, 6))
     
     # Calculate forward kinematics for all samples
+    from utils import forward_kinematics_TF  # Imports TensorFlow, only needed here
     positions_orientations, _ = forward_kinematics_TF(thetas, dh_params)
     
     # Extract end effector position and orientation
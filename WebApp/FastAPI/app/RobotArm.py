@@ -1,6 +1,8 @@
-from typing import List, Dict, Union
+from typing import List, Dict, Union, TYPE_CHECKING
 import numpy as np
-from spatialmath import SE3
+
+if TYPE_CHECKING:
+    from spatialmath import SE3
 
 class RobotArm:
     """
@@ -13,10 +15,11 @@ class RobotArm:
         dh_params (List[List[float]]): DH parameters for each joint [theta_home, d, a, alpha].
         joint_angles (np.ndarray): Current joint angles in degrees.
         joint_positions (np.ndarray): Current positions of each joint.
-        T (SE3): Current transformation matrix of the end effector.
+        T (np.ndarray): Current 4x4 homogeneous transformation matrix of the end effector.
 
     Note:
-        This class depends on the `spatialmath` library for SE3 transformations.
+        Transformations are computed with plain NumPy. The `spatialmath` library is
+        only imported when an SE3 object is requested through `get_SE3`.
         Linear measurements are in meters, and angular measurements are in degrees
         for input and output operations.
     """
@@ -37,7 +40,7 @@ class RobotArm:
         self.dh_params: List[List[float]] = dh_params
         self.joint_angles: np.ndarray = np.zeros(6)
         self.joint_positions: np.ndarray = np.zeros((6, 3))
-        self.T: SE3 = SE3()  # Cache for the current transformation matrix
+        self.T: np.ndarray = np.eye(4)  # Cache for the current transformation matrix
         self.initialize_pose()
 
     def initialize_pose(self) -> None:
@@ -82,7 +85,7 @@ class RobotArm:
             for i, params in enumerate(self.dh_params)
         }
 
-    def dh_transform(self, theta: float, d: float, a: float, alpha: float) -> SE3:
+    def dh_transform(self, theta: float, d: float, a: float, alpha: float) -> np.ndarray:
         """
         Calculate the DH transformation matrix using the provided DH parameters.
 
@@ -93,14 +96,14 @@ class RobotArm:
             alpha: Link twist.
 
         Returns:
-            The resulting SE3 transformation matrix.
+            The resulting 4x4 homogeneous transformation matrix.
         """
-        return SE3(np.array([
+        return np.array([
             [np.cos(theta), -np.sin(theta) * np.cos(alpha),  np.sin(theta) * np.sin(alpha), a * np.cos(theta)],
             [np.sin(theta),  np.cos(theta) * np.cos(alpha), -np.cos(theta) * np.sin(alpha), a * np.sin(theta)],
             [0,              np.sin(alpha),                np.cos(alpha),                 d],
             [0,              0,                            0,                             1]
-        ]))
+        ])
 
     def set_pose(self, joint_angles: Union[List[float], np.ndarray]) -> Dict[str, float]:
         """
@@ -121,14 +124,14 @@ class RobotArm:
         
         self.joint_angles = np.array(joint_angles)
         joint_angles_rad = np.radians(self.joint_angles)
-        self.T = SE3()
+        self.T = np.eye(4)
         self.joint_positions = np.zeros((6, 3))
 
         for i in range(6):
             theta_home, d, a, alpha = self.dh_params[i]
             theta = theta_home + joint_angles_rad[i]
-            self.T *= self.dh_transform(theta, d, a, alpha)
-            self.joint_positions[i, :] = self.T.t
+            self.T = self.T @ self.dh_transform(theta, d, a, alpha)
+            self.joint_positions[i, :] = self.T[:3, 3]
 
         return self.extract_pose()
 
@@ -152,8 +155,8 @@ class RobotArm:
             (roll, pitch, yaw) in degrees of the end effector. 
             Linear measurements have 4 decimal places, angular measurements have 2.
         """
-        pos = self.T.t
-        rpy = self.T.rpy()  # Returns (roll, pitch, yaw) in radians
+        pos = self.T[:3, 3]
+        rpy = self.rpy(self.T)  # Returns (roll, pitch, yaw) in radians
         return {
             "x": round(float(pos[0]), 4),  # meters, 4 decimal places
             "y": round(float(pos[1]), 4),  # meters, 4 decimal places
@@ -163,6 +166,46 @@ class RobotArm:
             "yaw": round(float(np.degrees(rpy[2])), 2)     # degrees, 2 decimal places
         }
 
+    def get_SE3(self) -> "SE3":
+        """
+        Get the current transformation of the end effector as a `spatialmath` SE3 object.
+
+        `spatialmath` is imported on the first call, so it is only loaded by callers
+        that actually need it.
+
+        Returns:
+            The current end effector transformation as an SE3 object.
+        """
+        from spatialmath import SE3
+        return SE3(self.T, check=False)
+
+    @staticmethod
+    def rpy(T: np.ndarray) -> np.ndarray:
+        """
+        Calculate roll, pitch and yaw angles from homogeneous transformation matrices.
+
+        Uses the same ZYX convention as `spatialmath`'s `SE3.rpy()`, i.e.
+        R = Rz(yaw) @ Ry(pitch) @ Rx(roll).
+
+        Args:
+            T: A 4x4 homogeneous transformation matrix (or a 3x3 rotation matrix),
+                or a stack of them with shape (..., 4, 4).
+
+        Returns:
+            An array of (roll, pitch, yaw) in radians, with shape (..., 3).
+        """
+        R = np.asarray(T)[..., :3, :3]
+        # Gimbal lock: pitch is +-90 degrees, roll is set to zero
+        gimbal_lock = np.abs(np.abs(R[..., 2, 0]) - 1) < 10 * np.finfo(np.float64).eps
+        roll = np.where(gimbal_lock, 0.0, np.arctan2(R[..., 2, 1], R[..., 2, 2]))
+        yaw = np.where(
+            gimbal_lock,
+            np.where(R[..., 2, 0] < 0, -np.arctan2(R[..., 0, 1], R[..., 0, 2]), np.arctan2(-R[..., 0, 1], -R[..., 0, 2])),
+            np.arctan2(R[..., 1, 0], R[..., 0, 0])
+        )
+        pitch = np.arctan2(-R[..., 2, 0], np.hypot(R[..., 0, 0], R[..., 1, 0]))
+        return np.stack([roll, pitch, yaw], axis=-1)
+
     def get_joint_positions(self) -> List[Dict[str, float]]:
         """
         Get the positions of all joints.
@@ -2,7 +2,7 @@ from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, conlist, confloat
 from typing import List, Dict
-import numpy as np
+import math
 from app.RobotArm import RobotArm
 from app.DH import dh_params
 import logging
@@ -45,7 +45,7 @@ def get_robot_arm():
         raise HTTPException(status_code=500, detail=f"Error initializing RobotArm: {str(e)}")
 
 class DHParams(BaseModel):
-    params: conlist(conlist(confloat(ge=-np.pi, le=np.pi), min_items=4, max_items=4), min_items=6, max_items=6)
+    params: conlist(conlist(confloat(ge=-math.pi, le=math.pi), min_items=4, max_items=4), min_items=6, max_items=6)
 
 class JointAngles(BaseModel):
     angles: conlist(confloat(ge=-180, le=180), min_items=6, max_items=6)
@@ -0,0 +1,83 @@
+"""
+Import-time / cold start benchmark.
+
+Each target is imported in a fresh Python process, so every run pays the full
+cold start cost, the same way an API pod or a short-lived CLI job does.
+The script reports the median time spent in the import itself, the median wall
+time of the whole process (interpreter startup included) and which heavy
+dependencies were pulled in by the import.
+
+Usage:
+    python benchmarks/import_time.py [--repeats 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# name: (working directory, import statement)
+TARGETS = {
+    "interpreter only": (REPO_ROOT, "pass"),
+    "numpy": (REPO_ROOT, "import numpy"),
+    "utils RobotArm": (os.path.join(REPO_ROOT, "utils"), "import RobotArm"),
+    "FastAPI app.RobotArm": (os.path.join(REPO_ROOT, "WebApp", "FastAPI"), "import app.RobotArm"),
+    "FastAPI app.main": (os.path.join(REPO_ROOT, "WebApp", "FastAPI"), "import app.main"),
+    "DatasetGen": (REPO_ROOT, "import DatasetGen"),
+}
+
+HEAVY_MODULES = ["spatialmath", "roboticstoolbox", "scipy", "tensorflow", "matplotlib"]
+
+SNIPPET = """
+import sys, time
+sys.path.insert(0, '.')
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(elapsed)
+print(','.join(heavy))
+"""
+
+
+def time_import(cwd, statement):
+    """
+    Import `statement` in a fresh interpreter.
+
+    Returns:
+        tuple: (import seconds, whole process seconds, heavy modules loaded)
+    """
+    code = SNIPPET.format(statement=statement, heavy=HEAVY_MODULES)
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", code], cwd=cwd, capture_output=True, text=True)
+    process_time = time.perf_counter() - start
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "unknown error"
+        raise RuntimeError(error)
+    elapsed, heavy = result.stdout.splitlines()[-2:]
+    return float(elapsed), process_time, [m for m in heavy.split(",") if m]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold import time of the project modules.")
+    parser.add_argument("--repeats", type=int, default=5, help="Number of fresh processes per target")
+    args = parser.parse_args()
+
+    print(f"{'target':<24}{'import (ms)':>12}{'process (ms)':>14}  heavy modules loaded")
+    for name, (cwd, statement) in TARGETS.items():
+        try:
+            runs = [time_import(cwd, statement) for _ in range(args.repeats)]
+        except RuntimeError as e:
+            print(f"{name:<24}{'-':>12}{'-':>14}  skipped ({e})")
+            continue
+        import_ms = statistics.median(r[0] * 1000 for r in runs)
+        process_ms = statistics.median(r[1] * 1000 for r in runs)
+        heavy = ", ".join(runs[-1][2]) or "none"
+        print(f"{name:<24}{import_ms:>12.1f}{process_ms:>14.1f}  {heavy}")
+
+
+if __name__ == "__main__":
+    main()
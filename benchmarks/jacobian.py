@@ -0,0 +1,58 @@
+"""
+Jacobian / manipulability throughput benchmark.
+
+Times the batched methods of `RobotArm` on random configurations. Their correctness
+is checked by `tests/test_jacobian.py`.
+
+Usage:
+    python benchmarks/jacobian.py [--samples 1000000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from RobotArm import RobotArm  # noqa: E402
+
+# Same DH parameters as WebApp/FastAPI/app/DH.py
+DH_PARAMS = [
+    [0, 10, 0, -np.pi/2],
+    [-np.pi/2, 0, 50, 0],
+    [0, 5, 0, -np.pi/2],
+    [0, 50, 0, np.pi/2],
+    [0, 0, 0, -np.pi/2],
+    [np.pi, 10, 0, 0]
+]
+
+
+def timeit(name, function, count):
+    """Run `function` once and print its time and throughput."""
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<40}{elapsed:>8.2f} s{count / elapsed:>14,.0f} configs/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the batched Jacobian of RobotArm.")
+    parser.add_argument("--samples", type=int, default=1_000_000, help="Number of random configurations")
+    parser.add_argument("--steps", type=int, default=91, help="Grid points per joint of the singularity map")
+    args = parser.parse_args()
+
+    robot = RobotArm(DH_PARAMS)
+    joint_angles = np.random.default_rng(1).uniform(-180, 180, (args.samples, 6))
+    grid_size = args.steps ** 3
+    timeit("jacobian (geometric)", lambda: robot.jacobian(joint_angles), args.samples)
+    timeit("jacobian (analytic)", lambda: robot.jacobian(joint_angles, kind="analytic"), args.samples)
+    timeit("manipulability", lambda: robot.manipulability(joint_angles), args.samples)
+    timeit("manipulability (condition=True)", lambda: robot.manipulability(joint_angles, condition=True), args.samples)
+    timeit(f"singularity_map ({args.steps}^3)", lambda: robot.singularity_map(steps=args.steps), grid_size)
+    timeit(f"singularity_map ({args.steps}^3, condition=True)",
+           lambda: robot.singularity_map(steps=args.steps, condition=True), grid_size)
+
+
+if __name__ == "__main__":
+    main()
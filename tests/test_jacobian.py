@@ -0,0 +1,162 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from RobotArm import RobotArm  # noqa: E402
+
+# Same DH parameters as WebApp/FastAPI/app/DH.py
+DH_PARAMS = [
+    [0, 10, 0, -np.pi/2],
+    [-np.pi/2, 0, 50, 0],
+    [0, 5, 0, -np.pi/2],
+    [0, 50, 0, np.pi/2],
+    [0, 0, 0, -np.pi/2],
+    [np.pi, 10, 0, 0]
+]
+
+
+@pytest.fixture
+def robot():
+    return RobotArm(DH_PARAMS)
+
+
+@pytest.fixture
+def joint_angles():
+    return np.random.default_rng(0).uniform(-180, 180, (500, 6))
+
+
+def finite_difference_jacobians(robot, joint_angles, step=1e-6):
+    """Geometric and analytic Jacobians from central finite differences of batch_transforms."""
+    R = robot.batch_transforms(joint_angles)[:, -1, :3, :3]
+    geometric = np.empty((len(joint_angles), 6, 6))
+    analytic = np.empty((len(joint_angles), 6, 6))
+    for i in range(6):
+        dq = np.zeros(6)
+        dq[i] = np.degrees(step)
+        T_plus = robot.batch_transforms(joint_angles + dq)[:, -1]
+        T_minus = robot.batch_transforms(joint_angles - dq)[:, -1]
+
+        velocity = (T_plus[:, :3, 3] - T_minus[:, :3, 3]) / (2 * step)
+        # Angular velocity from the skew symmetric matrix dR/dq @ R.T
+        W = (T_plus[:, :3, :3] - T_minus[:, :3, :3]) / (2 * step) @ R.transpose(0, 2, 1)
+        geometric[:, :3, i] = velocity
+        geometric[:, 3:, i] = np.stack([W[:, 2, 1], W[:, 0, 2], W[:, 1, 0]], axis=-1)
+
+        rpy_change = robot.rpy(T_plus) - robot.rpy(T_minus)
+        rpy_change = (rpy_change + np.pi) % (2 * np.pi) - np.pi  # Unwrap across +-180 degrees
+        analytic[:, :3, i] = velocity
+        analytic[:, 3:, i] = rpy_change / (2 * step)
+    return geometric, analytic
+
+
+def test_jacobian_matches_finite_differences(robot, joint_angles):
+    # Finite differences are not accurate close to gimbal lock
+    pitch = robot.rpy(robot.batch_transforms(joint_angles)[:, -1])[:, 1]
+    q = joint_angles[np.abs(np.degrees(pitch)) < 80]
+    geometric, analytic = finite_difference_jacobians(robot, q)
+    np.testing.assert_allclose(robot.jacobian(q), geometric, rtol=1e-5, atol=1e-5)
+    np.testing.assert_allclose(robot.jacobian(q, kind="analytic"), analytic, rtol=1e-5, atol=1e-5)
+
+
+def test_batch_transforms_matches_set_pose(robot, joint_angles):
+    T = robot.batch_transforms(joint_angles[:20])
+    for q, expected in zip(joint_angles[:20], T[:, -1]):
+        robot.set_pose(q)
+        np.testing.assert_allclose(robot.T, expected, atol=1e-12)
+
+
+def test_single_configuration_shapes(robot):
+    assert robot.jacobian(np.zeros(6)).shape == (6, 6)
+    measures = robot.manipulability([0, 30, 20, 0, 40, 0], condition=True, directions=True)
+    assert np.ndim(measures["manipulability"]) == 0
+    assert measures["singular_values"].shape == (6,)
+    assert measures["joint_directions"].shape == (6, 6)
+
+
+def test_empty_batch(robot):
+    empty = np.empty((0, 6))
+    assert robot.jacobian(empty).shape == (0, 6, 6)
+    measures = robot.manipulability(empty, condition=True, directions=True)
+    assert measures["manipulability"].shape == (0,)
+    assert measures["condition_number"].shape == (0,)
+    assert measures["singular_values"].shape == (0, 6)
+    assert measures["task_directions"].shape == (0, 6, 6)
+
+
+def test_chunking_gives_same_result(robot, joint_angles):
+    expected = robot.manipulability(joint_angles, condition=True)
+    expected_jacobian = robot.jacobian(joint_angles)
+    robot.batch_size = 7
+    chunked = robot.manipulability(joint_angles, condition=True)
+    np.testing.assert_array_equal(robot.jacobian(joint_angles), expected_jacobian)
+    for key in expected:
+        np.testing.assert_array_equal(chunked[key], expected[key])
+
+
+def test_manipulability_is_det_and_singular_value_product(robot, joint_angles):
+    measures = robot.manipulability(joint_angles, condition=True)
+    np.testing.assert_allclose(measures["manipulability"], np.prod(measures["singular_values"], axis=1), rtol=1e-6)
+    np.testing.assert_allclose(
+        measures["condition_number"], measures["singular_values"][:, 0] / measures["singular_values"][:, -1]
+    )
+
+
+def test_singular_pose(robot):
+    # q5 = 0 aligns the axes of joints 4 and 6 (wrist singularity)
+    measures = robot.manipulability(np.zeros(6), condition=True)
+    assert measures["manipulability"] < 1e-6
+    assert measures["condition_number"] == np.inf
+
+
+def test_analytic_is_nan_at_gimbal_lock(robot):
+    # The home pose has pitch = 90 degrees
+    assert np.isclose(abs(robot.rpy(robot.batch_transforms(np.zeros(6))[0, -1])[1]), np.pi / 2)
+    assert np.isnan(robot.jacobian(np.zeros(6), kind="analytic")).all()
+    measures = robot.manipulability(np.zeros((3, 6)), kind="analytic", condition=True)
+    assert np.isnan(measures["manipulability"]).all()
+    assert np.isnan(measures["condition_number"]).all()
+
+
+def test_singularity_map(robot, tmp_path):
+    filename = tmp_path / "map.npz"
+    smap = robot.singularity_map(joints=(1, 4), steps=5, condition=True, filename=str(filename))
+    assert smap["manipulability"].shape == (5, 5)
+    assert smap["condition_number"].shape == (5, 5)
+    q = np.zeros(6)
+    q[1], q[4] = smap["angles"][0, 3], smap["angles"][1, 2]
+    np.testing.assert_allclose(smap["manipulability"][3, 2], robot.manipulability(q)["manipulability"])
+    saved = np.load(filename)
+    np.testing.assert_array_equal(saved["manipulability"], smap["manipulability"])
+
+
+@pytest.mark.parametrize("joint_angles", [np.zeros(5), np.zeros((2, 7)), np.zeros((2, 2, 6))])
+def test_invalid_joint_angles(robot, joint_angles):
+    with pytest.raises(ValueError):
+        robot.jacobian(joint_angles)
+    with pytest.raises(ValueError):
+        robot.manipulability(joint_angles)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"joints": ()},
+    {"joints": (1, 1)},
+    {"joints": (6,)},
+    {"joints": (1.5,)},
+    {"joints": (True,)},
+    {"steps": 0},
+    {"steps": 2.5},
+    {"steps": True},
+    {"base_angles": np.zeros((2, 6))},
+    {"kind": "numeric"},
+])
+def test_invalid_singularity_map_arguments(robot, kwargs):
+    with pytest.raises(ValueError):
+        robot.singularity_map(**kwargs)
+
+
+def test_invalid_kind(robot):
+    with pytest.raises(ValueError):
+        robot.jacobian(np.zeros(6), kind="numeric")
@@ -1,6 +1,8 @@
-from typing import List, Dict, Union
+from typing import List, Dict, Optional, Sequence, Tuple, Union, TYPE_CHECKING
 import numpy as np
-from spatialmath import SE3
+
+if TYPE_CHECKING:
+    from spatialmath import SE3
 
 class RobotArm:
     """
@@ -13,14 +15,22 @@ class RobotArm:
         dh_params (List[List[float]]): DH parameters for each joint [theta_home, d, a, alpha].
         joint_angles (np.ndarray): Current joint angles in degrees.
         joint_positions (np.ndarray): Current positions of each joint.
-        T (SE3): Current transformation matrix of the end effector.
+        T (np.ndarray): Current 4x4 homogeneous transformation matrix of the end effector.
+        batch_size (int): Number of configurations processed at once by the batched
+            methods (`jacobian`, `manipulability`, `singularity_map`), bounding their memory use.
+        gimbal_lock_tolerance (float): Configurations with |cos(pitch)| below this value are
+            treated as gimbal lock, where the analytic Jacobian is set to nan.
 
     Note:
-        This class depends on the `spatialmath` library for SE3 transformations.
+        Transformations are computed with plain NumPy. The `spatialmath` library is
+        only imported when an SE3 object is requested through `get_SE3`.
         Linear measurements are in meters, and angular measurements are in degrees
         for input and output operations.
     """
 
+    batch_size: int = 65536
+    gimbal_lock_tolerance: float = 1e-6
+
     def __init__(self, dh_params: List[List[float]]):
         """
         Initialize the RobotArm with DH parameters.
@@ -37,7 +47,7 @@ class RobotArm:
         self.dh_params: List[List[float]] = dh_params
         self.joint_angles: np.ndarray = np.zeros(6)
         self.joint_positions: np.ndarray = np.zeros((6, 3))
-        self.T: SE3 = SE3()  # Cache for the current transformation matrix
+        self.T: np.ndarray = np.eye(4)  # Cache for the current transformation matrix
         self.initialize_pose()
 
     def initialize_pose(self) -> None:
@@ -47,7 +57,6 @@ class RobotArm:
         This method sets the initial pose of the robot using zero joint angles.
         """
         self.set_pose(self.joint_angles)
-        self.initialize_pose()
 
     def set_dh_params(self, dh_params: List[List[float]]) -> None:
         """
@@ -62,6 +71,7 @@ class RobotArm:
         if not isinstance(dh_params, list) or len(dh_params) != 6 or not all(len(joint) == 4 for joint in dh_params):
             raise ValueError("dh_params must be a list of 6 joints, each with 4 parameters")
         self.dh_params = dh_params
+        self.initialize_pose()
     
     def get_dh_params(self) -> Dict[str, Dict[str, float]]:
         """
@@ -82,7 +92,7 @@ class RobotArm:
             for i, params in enumerate(self.dh_params)
         }
 
-    def dh_transform(self, theta: float, d: float, a: float, alpha: float) -> SE3:
+    def dh_transform(self, theta: float, d: float, a: float, alpha: float) -> np.ndarray:
         """
         Calculate the DH transformation matrix using the provided DH parameters.
 
@@ -93,14 +103,14 @@ class RobotArm:
             alpha: Link twist.
 
         Returns:
-            The resulting SE3 transformation matrix.
+            The resulting 4x4 homogeneous transformation matrix.
         """
-        return SE3(np.array([
+        return np.array([
             [np.cos(theta), -np.sin(theta) * np.cos(alpha),  np.sin(theta) * np.sin(alpha), a * np.cos(theta)],
             [np.sin(theta),  np.cos(theta) * np.cos(alpha), -np.cos(theta) * np.sin(alpha), a * np.sin(theta)],
             [0,              np.sin(alpha),                np.cos(alpha),                 d],
             [0,              0,                            0,                             1]
-        ]))
+        ])
 
     def set_pose(self, joint_angles: Union[List[float], np.ndarray]) -> Dict[str, float]:
         """
@@ -121,14 +131,14 @@ class RobotArm:
         
         self.joint_angles = np.array(joint_angles)
         joint_angles_rad = np.radians(self.joint_angles)
-        self.T = SE3()
+        self.T = np.eye(4)
         self.joint_positions = np.zeros((6, 3))
 
         for i in range(6):
             theta_home, d, a, alpha = self.dh_params[i]
             theta = theta_home + joint_angles_rad[i]
-            self.T *= self.dh_transform(theta, d, a, alpha)
-            self.joint_positions[i, :] = self.T.t
+            self.T = self.T @ self.dh_transform(theta, d, a, alpha)
+            self.joint_positions[i, :] = self.T[:3, 3]
 
         return self.extract_pose()
 
@@ -152,8 +162,8 @@ class RobotArm:
             (roll, pitch, yaw) in degrees of the end effector. 
             Linear measurements have 4 decimal places, angular measurements have 2.
         """
-        pos = self.T.t
-        rpy = self.T.rpy()  # Returns (roll, pitch, yaw) in radians
+        pos = self.T[:3, 3]
+        rpy = self.rpy(self.T)  # Returns (roll, pitch, yaw) in radians
         return {
             "x": round(float(pos[0]), 4),  # meters, 4 decimal places
             "y": round(float(pos[1]), 4),  # meters, 4 decimal places
@@ -163,6 +173,46 @@ class RobotArm:
             "yaw": round(float(np.degrees(rpy[2])), 2)     # degrees, 2 decimal places
         }
 
+    def get_SE3(self) -> "SE3":
+        """
+        Get the current transformation of the end effector as a `spatialmath` SE3 object.
+
+        `spatialmath` is imported on the first call, so it is only loaded by callers
+        that actually need it.
+
+        Returns:
+            The current end effector transformation as an SE3 object.
+        """
+        from spatialmath import SE3
+        return SE3(self.T, check=False)
+
+    @staticmethod
+    def rpy(T: np.ndarray) -> np.ndarray:
+        """
+        Calculate roll, pitch and yaw angles from homogeneous transformation matrices.
+
+        Uses the same ZYX convention as `spatialmath`'s `SE3.rpy()`, i.e.
+        R = Rz(yaw) @ Ry(pitch) @ Rx(roll).
+
+        Args:
+            T: A 4x4 homogeneous transformation matrix (or a 3x3 rotation matrix),
+                or a stack of them with shape (..., 4, 4).
+
+        Returns:
+            An array of (roll, pitch, yaw) in radians, with shape (..., 3).
+        """
+        R = np.asarray(T)[..., :3, :3]
+        # Gimbal lock: pitch is +-90 degrees, roll is set to zero
+        gimbal_lock = np.abs(np.abs(R[..., 2, 0]) - 1) < 10 * np.finfo(np.float64).eps
+        roll = np.where(gimbal_lock, 0.0, np.arctan2(R[..., 2, 1], R[..., 2, 2]))
+        yaw = np.where(
+            gimbal_lock,
+            np.where(R[..., 2, 0] < 0, -np.arctan2(R[..., 0, 1], R[..., 0, 2]), np.arctan2(-R[..., 0, 1], -R[..., 0, 2])),
+            np.arctan2(R[..., 1, 0], R[..., 0, 0])
+        )
+        pitch = np.arctan2(-R[..., 2, 0], np.hypot(R[..., 0, 0], R[..., 1, 0]))
+        return np.stack([roll, pitch, yaw], axis=-1)
+
     def get_joint_positions(self) -> List[Dict[str, float]]:
         """
         Get the positions of all joints.
@@ -179,4 +229,277 @@ class RobotArm:
                 "z": round(float(pos[2]), 4)
             }
             for pos in self.joint_positions
-        ]
\ No newline at end of file
+        ]
+
+    def _as_batch(self, joint_angles: Union[List[float], np.ndarray]) -> np.ndarray:
+        """
+        Convert joint angles to a float array of shape (N, 6).
+
+        Raises:
+            ValueError: If joint_angles does not have shape (6,) or (N, 6).
+        """
+        q = np.asarray(joint_angles, dtype=np.float64)
+        if q.ndim == 1:
+            q = q[np.newaxis, :]
+        if q.ndim != 2 or q.shape[1] != 6:
+            raise ValueError("joint_angles must have shape (6,) or (N, 6)")
+        return q
+
+    def _frames(self, q: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculate the axes and origin of every joint frame for joint angles of shape (N, 6).
+
+        Returns:
+            The x, y and z axes and the origin of each frame in the base frame,
+            each an array of shape (6, N, 3).
+        """
+        theta_home, d, a, alpha = np.asarray(self.dh_params, dtype=np.float64).T
+        theta = (np.radians(q) + theta_home).T[..., np.newaxis]
+        ct, st = np.cos(theta), np.sin(theta)
+        ca, sa = np.cos(alpha), np.sin(alpha)
+
+        x, y, z, p = (np.empty((6, len(q), 3)) for _ in range(4))
+        x_prev, y_prev, z_prev, p_prev = np.eye(3)[0], np.eye(3)[1], np.eye(3)[2], np.zeros(3)
+        for i in range(6):
+            # Columns of T_prev @ dh_transform(theta, d, a, alpha), without the full 4x4 product
+            x[i] = ct[i] * x_prev + st[i] * y_prev
+            n = ct[i] * y_prev - st[i] * x_prev
+            y[i] = ca[i] * n + sa[i] * z_prev
+            z[i] = ca[i] * z_prev - sa[i] * n
+            p[i] = p_prev + d[i] * z_prev + a[i] * x[i]
+            x_prev, y_prev, z_prev, p_prev = x[i], y[i], z[i], p[i]
+        return x, y, z, p
+
+    def batch_transforms(self, joint_angles: Union[List[float], np.ndarray]) -> np.ndarray:
+        """
+        Calculate the transformation matrix of every joint frame for N configurations at once.
+
+        Args:
+            joint_angles: Joint angles in degrees, shape (6,) or (N, 6).
+
+        Returns:
+            An array of shape (N, 6, 4, 4) where [n, i] is the transformation from the
+            base frame to the frame of joint i + 1 (the last one is the end effector).
+
+        Raises:
+            ValueError: If joint_angles does not have shape (6,) or (N, 6).
+        """
+        q = self._as_batch(joint_angles)
+        T = np.zeros((len(q), 6, 4, 4))
+        for column, vectors in enumerate(self._frames(q)):
+            T[:, :, :3, column] = vectors.transpose(1, 0, 2)
+        T[:, :, 3, 3] = 1.0
+        return T
+
+    def jacobian(self, joint_angles: Union[List[float], np.ndarray], kind: str = "geometric") -> np.ndarray:
+        """
+        Calculate the Jacobian of the end effector for one or N configurations.
+
+        The geometric Jacobian maps joint rates to the linear velocity (vx, vy, vz) and
+        angular velocity (wx, wy, wz) of the end effector in the base frame.
+        The analytic Jacobian maps joint rates to the rates of (x, y, z, roll, pitch, yaw),
+        using the same roll/pitch/yaw convention as `get_pose`. It is undefined where pitch
+        is +-90 degrees: it is set to nan when |cos(pitch)| < gimbal_lock_tolerance, and its
+        roll/pitch/yaw rows grow as 1 / cos(pitch) when getting close to it.
+
+        Args:
+            joint_angles: Joint angles in degrees, shape (6,) or (N, 6).
+            kind: Either "geometric" or "analytic".
+
+        Returns:
+            An array of shape (6, 6), or (N, 6, 6) for batched input. Columns are
+            per radian of joint motion.
+
+        Raises:
+            ValueError: If joint_angles has the wrong shape or kind is unknown.
+        """
+        if kind not in ("geometric", "analytic"):
+            raise ValueError("kind must be either 'geometric' or 'analytic'")
+        q = self._as_batch(joint_angles)
+        J = np.empty((len(q), 6, 6))
+        for start in range(0, len(q), self.batch_size):
+            J[start:start + self.batch_size] = self._jacobian(q[start:start + self.batch_size], kind)
+        return J[0] if np.ndim(joint_angles) == 1 else J
+
+    def _jacobian(self, q: np.ndarray, kind: str) -> np.ndarray:
+        """Calculate the Jacobian for a batch of joint angles of shape (N, 6)."""
+        x, y, z, p = self._frames(q)
+        # Joint i rotates about the z axis of frame i - 1, frame 0 being the base frame
+        J = np.empty((len(q), 6, 6))
+        axis, origin = np.eye(3)[2], np.zeros(3)
+        for i in range(6):
+            J[:, :3, i] = np.cross(axis, p[-1] - origin)
+            J[:, 3:, i] = axis
+            axis, origin = z[i], p[i]
+        if kind == "geometric":
+            return J
+
+        # Map the angular velocity to roll/pitch/yaw rates, R = Rz(yaw) @ Ry(pitch) @ Rx(roll)
+        _, pitch, yaw = np.moveaxis(self.rpy(np.stack([x[-1], y[-1], z[-1]], axis=-1)), -1, 0)
+        cp, sp = np.cos(pitch), np.sin(pitch)
+        cy, sy = np.cos(yaw), np.sin(yaw)
+        wx, wy, wz = J[:, 3].copy(), J[:, 4].copy(), J[:, 5].copy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            roll_rate = (cy[:, None] * wx + sy[:, None] * wy) / cp[:, None]
+        J[:, 3] = roll_rate
+        J[:, 4] = -sy[:, None] * wx + cy[:, None] * wy
+        J[:, 5] = wz + sp[:, None] * roll_rate
+        J[np.abs(cp) < self.gimbal_lock_tolerance] = np.nan
+        return J
+
+    @staticmethod
+    def _measures(J: np.ndarray, condition: bool, directions: bool) -> Dict[str, np.ndarray]:
+        """Calculate the manipulability measures of a batch of Jacobians of shape (N, 6, 6)."""
+        # Jacobians at gimbal lock (analytic only) are nan and get nan measures
+        valid = np.isfinite(J).all(axis=(1, 2))
+        J = J[valid]
+        result = {"manipulability": np.full(len(valid), np.nan)}
+        # J is square, so sqrt(det(J @ J.T)) is |det(J)|, without an SVD
+        result["manipulability"][valid] = np.abs(np.linalg.det(J))
+        if not (condition or directions):
+            return result
+
+        result["singular_values"] = np.full((len(valid), 6), np.nan)
+        if directions:
+            result["task_directions"] = np.full((len(valid), 6, 6), np.nan)
+            result["joint_directions"] = np.full((len(valid), 6, 6), np.nan)
+            U, S, Vt = np.linalg.svd(J)
+            result["task_directions"][valid] = U
+            result["joint_directions"][valid] = Vt
+        else:
+            S = np.linalg.svd(J, compute_uv=False)
+        result["singular_values"][valid] = S
+
+        # Same rank tolerance as np.linalg.matrix_rank
+        rank_deficient = S[:, -1] <= S[:, 0] * 6 * np.finfo(np.float64).eps
+        with np.errstate(divide="ignore"):
+            condition_number = np.where(rank_deficient, np.inf, S[:, 0] / S[:, -1])
+        result["condition_number"] = np.full(len(valid), np.nan)
+        result["condition_number"][valid] = condition_number
+        return result
+
+    def manipulability(self, joint_angles: Union[List[float], np.ndarray], kind: str = "geometric",
+                       condition: bool = False, directions: bool = False) -> Dict[str, np.ndarray]:
+        """
+        Calculate manipulability measures of the Jacobian for one or N configurations.
+
+        Only the manipulability index is computed by default. The condition number and the
+        singular directions need an SVD per configuration, which is about ten times slower.
+
+        Args:
+            joint_angles: Joint angles in degrees, shape (6,) or (N, 6).
+            kind: Jacobian to use, either "geometric" or "analytic".
+            condition: Also return the condition number and the singular values.
+            directions: Also return the singular values and directions of the Jacobian.
+
+        Returns:
+            A dictionary with the following arrays (without the leading N for a single configuration):
+            - "manipulability": Yoshikawa manipulability index sqrt(det(J @ J.T)), shape (N,).
+              Because of rounding it is not exactly zero at a singularity, only very small
+              (around 1e-11 for the default DH parameters, against 1e4 to 1e5 away from it).
+              Compare it to a threshold, e.g. 1e-6 times the largest value of the workspace.
+            - "condition_number": Only if condition or directions is True. Ratio of the largest
+              to the smallest singular value, shape (N,). It is inf where J is rank deficient
+              at the `np.linalg.matrix_rank` tolerance. Values above about 1e6 are also
+              numerically singular.
+            - "singular_values": Only if condition or directions is True. Singular values of J
+              in descending order, shape (N, 6).
+            - "joint_directions": Only if directions is True. Unit joint space directions
+              (rows, matching singular_values), shape (N, 6, 6). The last row is the joint
+              motion that moves the end effector the least.
+            - "task_directions": Only if directions is True. Unit task space directions
+              (columns, matching singular_values), shape (N, 6, 6). The last column is the
+              end effector motion that is hardest to achieve.
+            All values are nan where the analytic Jacobian is at gimbal lock.
+
+        Raises:
+            ValueError: If joint_angles has the wrong shape or kind is unknown.
+        """
+        if kind not in ("geometric", "analytic"):
+            raise ValueError("kind must be either 'geometric' or 'analytic'")
+        q = self._as_batch(joint_angles)
+        chunks = [
+            self._measures(self._jacobian(q[start:start + self.batch_size], kind), condition, directions)
+            # At least one chunk, so an empty batch still gives correctly shaped empty arrays
+            for start in range(0, max(len(q), 1), self.batch_size)
+        ]
+        result = {key: np.concatenate([chunk[key] for chunk in chunks]) for key in chunks[0]}
+        if np.ndim(joint_angles) == 1:
+            return {key: value[0] for key, value in result.items()}
+        return result
+
+    def singularity_map(self, joints: Sequence[int] = (1, 2, 4), steps: int = 91,
+                        angle_range: Tuple[float, float] = (-180.0, 180.0),
+                        base_angles: Optional[Union[List[float], np.ndarray]] = None,
+                        kind: str = "geometric", condition: bool = False,
+                        filename: Optional[str] = None) -> Dict[str, np.ndarray]:
+        """
+        Calculate the manipulability (and optionally the condition number) on a grid of joint angles.
+
+        The selected joints are swept over a regular grid while the other joints are held
+        at base_angles. The default sweeps joints 2, 3 and 5, which are the ones that
+        decide the singularities of the geometric Jacobian (joints 1 and 6 only rotate it).
+
+        Args:
+            joints: Indices (0 based) of the joints to sweep.
+            steps: Number of grid points per swept joint.
+            angle_range: (min, max) of the swept joint angles in degrees, both included.
+            base_angles: Joint angles in degrees for the joints that are not swept, shape (6,).
+                Defaults to the current joint angles.
+            kind: Jacobian to use, either "geometric" or "analytic".
+            condition: Also compute the condition number, which needs an SVD per grid point.
+            filename: If given, the map is saved to this file with `np.savez`.
+
+        Returns:
+            A dictionary with:
+            - "joints": The swept joint indices, shape (k,).
+            - "angles": The grid angles in degrees of each swept joint, shape (k, steps).
+            - "base_angles": The angles of the other joints, shape (6,).
+            - "manipulability": Manipulability index on the grid, shape (steps,) * k.
+            - "condition_number": Only if condition is True. Condition number on the grid,
+              shape (steps,) * k.
+            See `manipulability` for how these values behave at a singularity.
+
+        Raises:
+            ValueError: If the joints, steps, base_angles or kind are invalid.
+        """
+        def is_integer(value) -> bool:
+            return isinstance(value, (int, np.integer)) and not isinstance(value, (bool, np.bool_))
+
+        joints = list(joints)
+        if (not joints or len(set(joints)) != len(joints)
+                or not all(is_integer(j) and 0 <= j < 6 for j in joints)):
+            raise ValueError("joints must be a non-empty list of distinct joint indices between 0 and 5")
+        if not is_integer(steps) or steps < 1:
+            raise ValueError("steps must be a positive integer")
+        if kind not in ("geometric", "analytic"):
+            raise ValueError("kind must be either 'geometric' or 'analytic'")
+        base = np.asarray(self.joint_angles if base_angles is None else base_angles, dtype=np.float64)
+        if base.shape != (6,):
+            raise ValueError("base_angles must have shape (6,)")
+
+        angles = np.linspace(angle_range[0], angle_range[1], steps)
+        shape = (steps,) * len(joints)
+        size = steps ** len(joints)
+        maps = {"manipulability": np.empty(size)}
+        if condition:
+            maps["condition_number"] = np.empty(size)
+
+        for start in range(0, size, self.batch_size):
+            index = np.unravel_index(np.arange(start, min(start + self.batch_size, size)), shape)
+            q = np.tile(base, (len(index[0]), 1))
+            for axis, joint in enumerate(joints):
+                q[:, joint] = angles[index[axis]]
+            measures = self._measures(self._jacobian(q, kind), condition, directions=False)
+            for key, values in maps.items():
+                values[start:start + len(q)] = measures[key]
+
+        result = {
+            "joints": np.array(joints),
+            "angles": np.tile(angles, (len(joints), 1)),
+            "base_angles": base,
+        }
+        result.update({key: values.reshape(shape) for key, values in maps.items()})
+        if filename is not None:
+            np.savez(filename, **result)
+        return result